@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from senders import count_distinct_by
+
+# --- Time Granularity Options: selector label -> chart title prefix ---
+GRANULARITIES = {
+    "Day": "Daily",
+    "Week": "Weekly",
+    "Month": "Monthly",
+    "Quarter": "Quarterly",
+}
+
+
+# --- Bucket Start Dates ----------------------------------------------------------------------------------
+# Weeks start on Monday, matching Snowflake's DATE_TRUNC('WEEK', ...). Day 0 of the epoch is a Thursday,
+# hence the +3 shift to get a Monday-based weekday.
+def bucket_dates(dates, granularity):
+    days = np.asarray(dates).astype("datetime64[D]")
+    if granularity == "Day":
+        return days
+    if granularity == "Week":
+        return days - (days.astype(np.int64) + 3) % 7
+    months = days.astype("datetime64[M]")
+    if granularity == "Quarter":
+        months = months - months.astype(np.int64) % 3
+    return months.astype("datetime64[D]")
+
+
+# --- Rebucket a Daily Frame ------------------------------------------------------------------------------
+# Additive columns (`sums`) are summed per bucket; running totals (`lasts`) take the bucket's value on its
+# latest day (the frame is sorted by date first). The `distinct` column holds each day's sender state
+# (one row per day and sender), so the union of days in a bucket is exact: each sender counts once per
+# bucket however many days it appears on (see senders.count_distinct_by).
+def rebucket(daily, granularity, date_col="Day", keys=(), sums=(), lasts=(), distinct=None, distinct_name=None):
+    keys = list(keys)
+    frame = daily.assign(Date=bucket_dates(daily[date_col], granularity))
+    if lasts:
+        frame = frame.sort_values(date_col, kind="stable")
+    group_cols = ["Date"] + keys
+
+    grouped = frame.groupby(group_cols, sort=True, observed=True, dropna=False)
+    result = grouped[list(sums)].sum()
+    if lasts:
+        result = result.join(grouped[list(lasts)].last())
+    if distinct is not None:
+        result[distinct_name or distinct] = count_distinct_by(grouped.ngroup(), frame[distinct], grouped.ngroups)
+    result = result.reset_index()
+    result["Date"] = pd.to_datetime(result["Date"])
+    return result
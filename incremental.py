@@ -0,0 +1,55 @@
+import threading
+
+import pandas as pd
+import streamlit as st
+from pandas.api.types import union_categoricals
+
+
+# --- Latest result of every incremental loader, kept once per process: {loader: (start, end, frame)} ---
+# Sessions run in separate threads, so reads and writes go through the lock. Fetches run outside it: two
+# sessions may fetch the same tail at once, and the result with the later end date is kept.
+_snapshots_lock = threading.Lock()
+
+@st.cache_resource
+def _snapshots():
+    return {}
+
+
+# --- Incremental Append ---------------------------------------------------------------------------------
+# When the end date moves forward for a start date we have already served, only the tail is queried:
+# every bucket before the last cached one is kept as-is, the last (possibly still open) bucket is
+# recomputed together with the new buckets, and the two parts are merged. Running totals listed in
+# `cumulative` ({"Cumulative Column": "Base Column"}) are carried forward from the last kept row, and
+# categorical columns stay categorical across the merge.
+def load_incremental(name, start_date, end_date, fetch, bucket_col, cumulative=None):
+    store = _snapshots()
+    with _snapshots_lock:
+        snapshot = store.get(name)
+    if snapshot is not None and snapshot[0] != start_date:
+        snapshot = None
+
+    if snapshot is not None and snapshot[1] == end_date:
+        return snapshot[2]
+
+    if snapshot is None or snapshot[1] > end_date or snapshot[2].empty:
+        df = fetch(start_date, end_date)
+    else:
+        cached = snapshot[2]
+        buckets = pd.to_datetime(cached[bucket_col])
+        open_bucket = buckets.max()
+        kept = cached[buckets < open_bucket]
+
+        tail = fetch(max(start_date, open_bucket.date()), end_date)
+        for cumulative_col, base_col in (cumulative or {}).items():
+            carried = kept[cumulative_col].iloc[-1] if not kept.empty else 0
+            tail[cumulative_col] = tail[base_col].cumsum() + carried
+
+        df = pd.concat([kept, tail], ignore_index=True)
+        for col in kept.columns[kept.dtypes == "category"]:
+            df[col] = union_categoricals([kept[col], tail[col]])
+
+    with _snapshots_lock:
+        current = store.get(name)
+        if current is None or current[0] != start_date or current[1] < end_date:
+            store[name] = (start_date, end_date, df)
+    return df
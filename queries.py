@@ -0,0 +1,74 @@
+import datetime
+
+import numpy as np
+
+from senders import SENDER_HASH_SQL
+
+# --- Query Registry ----------------------------------------------------------------------------------------
+# Every warehouse query lives here as a pyformat template (the Snowflake connector's default paramstyle).
+# pyformat binding is client-side: the connector escapes and quotes each parameter, then inserts it into
+# the statement text. Templates are rendered once with their whitespace collapsed and parameters are
+# normalized, so identical logical requests produce byte-identical statements and Snowflake's result cache
+# and our own cache keys hit reliably. Values only ever reach the SQL through the connector's escaping,
+# never through f-string interpolation. A sequence binds as a bare comma list, so IN needs its own parens.
+_TEMPLATES = {
+    # One row per (day, source chain, destination chain, swapper) with the number of swaps.
+    "swap_facts": f"""
+        SELECT
+            block_timestamp::date AS "Day",
+            source_chain AS "Source Chain",
+            destination_chain AS "Destination Chain",
+            {SENDER_HASH_SQL} AS "Swapper",
+            COUNT(DISTINCT tx_hash) AS "Number of Swaps"
+        FROM axelar.defi.ez_bridge_squid
+        WHERE block_timestamp::date >= %(start_date)s
+          AND block_timestamp::date <= %(end_date)s
+        GROUP BY 1, 2, 3, 4
+        ORDER BY 1
+    """,
+    # Swappers by the day they were first seen across all history, within the range.
+    "daily_new_swappers": """
+        WITH new_user AS (
+            SELECT MIN(block_timestamp::date) AS date, sender AS user
+            FROM axelar.defi.ez_bridge_squid
+            GROUP BY 2
+        )
+        SELECT
+            date AS "Day",
+            COUNT(DISTINCT user) AS "New Swappers",
+            SUM(COUNT(DISTINCT user)) OVER (ORDER BY date ASC) AS "Cumulative New Swappers"
+        FROM new_user
+        WHERE date >= %(start_date)s
+          AND date <= %(end_date)s
+        GROUP BY 1
+        ORDER BY 1
+    """,
+    # Address and token count for the given sender hashes only.
+    "swapper_details": f"""
+        SELECT
+            {SENDER_HASH_SQL} AS "Swapper",
+            sender AS "Address",
+            COUNT(DISTINCT token_address) AS "Tokens"
+        FROM axelar.defi.ez_bridge_squid
+        WHERE block_timestamp::date >= %(start_date)s
+          AND block_timestamp::date <= %(end_date)s
+          AND {SENDER_HASH_SQL} IN (%(swapper_hashes)s)
+        GROUP BY 1, 2
+    """,
+}
+
+QUERIES = {name: " ".join(template.split()) for name, template in _TEMPLATES.items()}
+
+
+# --- Dates bind as ISO strings; sequences (sender hashes) bind as sorted int tuples ---
+def _canonical(value):
+    if isinstance(value, datetime.date):
+        return value.isoformat()[:10]
+    if isinstance(value, (list, tuple, set, frozenset, np.ndarray)):
+        return tuple(sorted(int(v) for v in value))
+    return value
+
+
+# --- Render: (statement, params) ready for cursor.execute ---
+def render(name, **params):
+    return QUERIES[name], {key: _canonical(value) for key, value in sorted(params.items())}
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+# --- Sender Encoding ---------------------------------------------------------------------------------------
+# Senders leave the warehouse as 64-bit hashes (Snowflake's HASH), so every local distinct count,
+# per-sender groupby and join runs on int64 arrays instead of millions of address strings. Addresses are
+# fetched back only for the handful of senders a table actually shows.
+# HASH(NULL) is not NULL, so NULL senders are kept NULL in SQL and held locally as MISSING_SENDER; every
+# distinct count and per-sender aggregate skips them, as COUNT(DISTINCT sender) does.
+SENDER_HASH_SQL = "IFF(sender IS NULL, NULL, HASH(sender))"
+MISSING_SENDER = np.iinfo(np.int64).min
+
+
+def as_sender_hashes(values):
+    return pd.array(values, dtype="Int64").to_numpy(dtype=np.int64, na_value=MISSING_SENDER)
+
+
+def present(hashes):
+    return hashes != MISSING_SENDER
+
+
+# --- Dense IDs: present hashes -> 0..n-1 int32 positions, for bincount-style per-sender aggregation ---
+def dense_ids(hashes):
+    uniques, ids = np.unique(as_sender_hashes(hashes), return_inverse=True)
+    return uniques, ids.astype(np.int32)
+
+
+def count_distinct(hashes):
+    hashes = as_sender_hashes(hashes)
+    return len(np.unique(hashes[present(hashes)]))
+
+
+# --- Distinct senders per group: group_codes are 0..n_groups-1 positions from groupby().ngroup(); rows in
+# no group (NaN or negative codes) and missing senders are skipped ---
+def count_distinct_by(group_codes, hashes, n_groups):
+    group_codes = np.nan_to_num(np.asarray(group_codes, dtype=np.float64), nan=-1).astype(np.int64)
+    hashes = as_sender_hashes(hashes)
+    in_group = (group_codes >= 0) & present(hashes)
+    uniques, ids = dense_ids(hashes[in_group])
+    width = max(len(uniques), 1)
+    pairs = np.unique(group_codes[in_group] * width + ids)
+    return np.bincount(pairs // width, minlength=n_groups)
+
+
+def sum_per_sender(hashes, values):
+    hashes = as_sender_hashes(hashes)
+    keep = present(hashes)
+    uniques, ids = dense_ids(hashes[keep])
+    totals = np.bincount(ids, weights=np.asarray(values, dtype=np.float64)[keep], minlength=len(uniques))
+    return uniques, totals.astype(np.int64)
+
+
+def top_senders(hashes, values, n):
+    uniques, totals = sum_per_sender(hashes, values)
+    order = np.argsort(-totals, kind="stable")[:n]
+    return uniques[order], totals[order]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# --- The app's shared modules live at the repo root, next to 🏠Home.py ---
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,83 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from granularity import bucket_dates, rebucket
+
+# Pre-epoch, the epoch itself (a Thursday), leap days, year boundaries and every weekday.
+DATES = pd.to_datetime([
+    "1969-12-28", "1969-12-29", "1969-12-31", "1970-01-01", "1970-01-04", "1970-01-05",
+    "1899-03-15", "2000-02-29", "2021-12-31", "2022-01-01", "2022-01-02", "2022-01-03",
+    "2024-02-29", "2024-03-31", "2024-04-01", "2024-12-30", "2025-06-01",
+])
+
+
+def starts(period_freq):
+    return DATES.to_period(period_freq).start_time.to_numpy().astype("datetime64[D]")
+
+
+def test_day_buckets_are_the_dates():
+    assert (bucket_dates(DATES, "Day") == DATES.to_numpy().astype("datetime64[D]")).all()
+
+
+def test_week_buckets_start_on_monday_like_date_trunc_week():
+    # W-SUN periods run Monday..Sunday, the same weeks as Snowflake's DATE_TRUNC('WEEK', ...).
+    weeks = bucket_dates(DATES, "Week")
+    assert (weeks == starts("W-SUN")).all()
+    assert (pd.DatetimeIndex(weeks).weekday == 0).all()
+
+
+def test_month_and_quarter_buckets():
+    assert (bucket_dates(DATES, "Month") == starts("M")).all()
+    assert (bucket_dates(DATES, "Quarter") == starts("Q")).all()
+
+
+def test_bucket_dates_accepts_date_objects():
+    days = pd.Series(DATES.date)
+    assert (bucket_dates(days, "Week") == starts("W-SUN")).all()
+
+
+def daily_activity():
+    return pd.DataFrame({
+        "Day": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-03", "2024-01-08"]),
+        "Path": pd.Categorical(["a", "a", "a", "b", "a"]),
+        "Swapper": np.array([7, 7, 9, 7, 7], dtype=np.int64),
+        "Number of Swaps": np.array([1, 2, 3, 4, 5], dtype=np.int64),
+    })
+
+
+def test_distinct_swappers_across_days_are_counted_once_per_bucket():
+    weekly = rebucket(
+        daily_activity(), "Week", sums=["Number of Swaps"], distinct="Swapper", distinct_name="Number of Swappers"
+    )
+
+    # Swapper 7 is active on three days of the first week: one swapper, not three.
+    assert weekly["Date"].tolist() == list(pd.to_datetime(["2024-01-01", "2024-01-08"]))
+    assert weekly["Number of Swaps"].tolist() == [10, 5]
+    assert weekly["Number of Swappers"].tolist() == [2, 1]
+
+
+def test_distinct_swappers_per_key():
+    weekly = rebucket(
+        daily_activity(), "Week", keys=["Path"], sums=["Number of Swaps"],
+        distinct="Swapper", distinct_name="Number of Swappers"
+    )
+    assert weekly[["Path", "Number of Swaps", "Number of Swappers"]].values.tolist() == [
+        ["a", 6, 2], ["b", 4, 1], ["a", 5, 1],
+    ]
+
+
+def test_lasts_takes_the_running_total_at_each_buckets_latest_day():
+    daily = pd.DataFrame({
+        "Day": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-15", "2024-01-09"]),
+        "New Swappers": [3, 2, 1, 4],
+        "Cumulative New Swappers": [15, 12, 20, 19],
+    })
+
+    weekly = rebucket(daily, "Week", sums=["New Swappers"], lasts=["Cumulative New Swappers"])
+    assert weekly["New Swappers"].tolist() == [5, 4, 1]
+    assert weekly["Cumulative New Swappers"].tolist() == [15, 19, 20]
+
+    monthly = rebucket(daily, "Month", sums=["New Swappers"], lasts=["Cumulative New Swappers"])
+    assert monthly[["New Swappers", "Cumulative New Swappers"]].values.tolist() == [[10, 20]]
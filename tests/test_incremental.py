@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from incremental import _snapshots, load_incremental
+
+# --- Daily swap counts: activity stops on Jan 10 and resumes on Jan 22 ---
+EVENTS = {
+    datetime.date(2024, 1, 1): 2,
+    datetime.date(2024, 1, 3): 1,
+    datetime.date(2024, 1, 9): 4,
+    datetime.date(2024, 1, 10): 3,
+    datetime.date(2024, 1, 22): 5,
+    datetime.date(2024, 1, 23): 1,
+    datetime.date(2024, 2, 6): 2,
+}
+
+
+class WeeklySource:
+    # Mimics the warehouse: weekly buckets of the range, with a running total that starts inside the range.
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        days = [day for day in sorted(EVENTS) if start_date <= day <= end_date]
+        df = pd.DataFrame({"Day": pd.to_datetime(days), "Swaps": [EVENTS[day] for day in days]})
+        df["Week"] = df["Day"] - pd.to_timedelta(df["Day"].dt.weekday, unit="D")
+        weekly = df.groupby("Week", as_index=False)["Swaps"].sum()
+        weekly["Cumulative Swaps"] = weekly["Swaps"].cumsum()
+        return weekly
+
+
+START = datetime.date(2024, 1, 1)
+CUMULATIVE = {"Cumulative Swaps": "Swaps"}
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshots():
+    _snapshots().clear()
+    yield
+    _snapshots().clear()
+
+
+def load(source, end_date):
+    return load_incremental("weekly_swaps", START, end_date, source, "Week", cumulative=CUMULATIVE)
+
+
+def test_forward_move_queries_only_the_open_bucket_and_tail():
+    source = WeeklySource()
+    load(source, datetime.date(2024, 1, 9))
+    result = load(source, datetime.date(2024, 2, 7))
+
+    assert source.calls[1] == (datetime.date(2024, 1, 8), datetime.date(2024, 2, 7))
+    pd.testing.assert_frame_equal(result, WeeklySource()(START, datetime.date(2024, 2, 7)))
+
+
+def test_forward_move_when_last_bucket_ends_before_old_end_date():
+    source = WeeklySource()
+    load(source, datetime.date(2024, 1, 18))
+    result = load(source, datetime.date(2024, 1, 31))
+
+    assert source.calls[1] == (datetime.date(2024, 1, 8), datetime.date(2024, 1, 31))
+    pd.testing.assert_frame_equal(result, WeeklySource()(START, datetime.date(2024, 1, 31)))
+
+
+def test_backward_move_fetches_in_full_and_keeps_snapshot():
+    source = WeeklySource()
+    wide = load(source, datetime.date(2024, 2, 7))
+    result = load(source, datetime.date(2024, 1, 10))
+
+    assert source.calls[1] == (START, datetime.date(2024, 1, 10))
+    pd.testing.assert_frame_equal(result, WeeklySource()(START, datetime.date(2024, 1, 10)))
+    start_date, end_date, frame = _snapshots()["weekly_swaps"]
+    assert (start_date, end_date) == (START, datetime.date(2024, 2, 7))
+    assert frame is wide
+
+
+def test_empty_snapshot_fetches_in_full():
+    source = WeeklySource()
+    empty_start = datetime.date(2023, 12, 1)
+    first = load_incremental("weekly_swaps", empty_start, datetime.date(2023, 12, 20), source, "Week")
+    assert first.empty
+
+    result = load_incremental("weekly_swaps", empty_start, datetime.date(2024, 1, 5), source, "Week")
+    assert source.calls[1] == (empty_start, datetime.date(2024, 1, 5))
+    pd.testing.assert_frame_equal(result, WeeklySource()(empty_start, datetime.date(2024, 1, 5)))
+
+
+def test_cumulative_is_carried_across_the_seam():
+    source = WeeklySource()
+    load(source, datetime.date(2024, 1, 23))
+    result = load(source, datetime.date(2024, 2, 7))
+
+    # The tail query restarts its running total at the open bucket; the merge carries it forward.
+    tail = source(datetime.date(2024, 1, 22), datetime.date(2024, 2, 7))
+    assert tail["Cumulative Swaps"].tolist() == [6, 8]
+    assert result["Cumulative Swaps"].tolist() == [3, 10, 16, 18]
+
+
+def test_same_range_returns_the_snapshot_without_fetching():
+    source = WeeklySource()
+    first = load(source, datetime.date(2024, 1, 23))
+    second = load(source, datetime.date(2024, 1, 23))
+
+    assert len(source.calls) == 1
+    assert second is first
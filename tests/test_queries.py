@@ -0,0 +1,60 @@
+import datetime
+
+import numpy as np
+import pytest
+
+converter = pytest.importorskip("snowflake.connector.converter")
+
+from queries import QUERIES, render
+
+
+# --- Bind params exactly as the connector's _process_params_dict does: to_snowflake -> escape -> quote ---
+def bound_sql(name, **params):
+    conv = converter.SnowflakeConverter()
+    statement, bound = render(name, **params)
+    processed = {key: conv.quote(conv.escape(conv.to_snowflake(value))) for key, value in bound.items()}
+    return statement % processed
+
+
+def test_swapper_details_in_list_is_parenthesized():
+    sql = bound_sql(
+        "swapper_details",
+        start_date=datetime.date(2022, 1, 1),
+        end_date=datetime.date(2025, 6, 1),
+        swapper_hashes=(3, -1),
+    )
+    assert "AND IFF(sender IS NULL, NULL, HASH(sender)) IN (-1,3) GROUP BY 1, 2" in sql
+    assert "block_timestamp::date >= '2022-01-01'" in sql
+    assert "block_timestamp::date <= '2025-06-01'" in sql
+
+
+def test_same_logical_request_renders_identical_sql():
+    first = bound_sql(
+        "swapper_details",
+        start_date=datetime.date(2024, 3, 1),
+        end_date=datetime.datetime(2024, 3, 31, 12, 0),
+        swapper_hashes=[5, 1, 3],
+    )
+    second = bound_sql(
+        "swapper_details",
+        swapper_hashes=(3, 5, 1),
+        end_date=datetime.date(2024, 3, 31),
+        start_date=datetime.date(2024, 3, 1),
+    )
+    assert first == second
+
+
+def test_templates_are_whitespace_canonical():
+    for statement in QUERIES.values():
+        assert statement == " ".join(statement.split())
+
+
+def test_date_params_are_quoted_literals():
+    sql = bound_sql("swap_facts", start_date="2022-01-01'; DROP TABLE x; --", end_date=datetime.date(2022, 2, 1))
+    assert "'2022-01-01\\'; DROP TABLE x; --'" in sql
+
+
+def test_numpy_hash_arrays_are_canonicalized():
+    _, from_array = render("swapper_details", swapper_hashes=np.array([3, 1], dtype=np.int64))
+    _, from_tuple = render("swapper_details", swapper_hashes=(1, 3))
+    assert from_array == from_tuple == {"swapper_hashes": (1, 3)}
@@ -0,0 +1,129 @@
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("streamlit")
+pytest.importorskip("snowflake.connector")
+
+import semantic
+from senders import MISSING_SENDER, as_sender_hashes as as_hashes
+
+
+class FakeCursor:
+    def __init__(self, table):
+        self.table = table
+        self.executed = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params):
+        self.executed = (statement, params)
+        return self
+
+    def fetch_arrow_all(self, force_return_table=False):
+        return self.table
+
+
+class FakeConnection:
+    def __init__(self, table):
+        self.last_cursor = FakeCursor(table)
+
+    def cursor(self):
+        return self.last_cursor
+
+
+def test_swap_facts_arrive_compact_with_exact_nullable_hashes(monkeypatch):
+    table = pa.table({
+        "Day": pa.array([datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)]),
+        "Source Chain": ["ethereum", "polygon"],
+        "Destination Chain": ["arbitrum", "arbitrum"],
+        "Swapper": pa.array([2**62 + 1, None], pa.int64()),
+        "Number of Swaps": pa.array([3, 1], pa.int16()),
+    })
+    connection = FakeConnection(table)
+    monkeypatch.setattr(semantic, "get_open_connection", lambda: connection)
+
+    facts = semantic.fetch_swap_facts(datetime.date(2024, 1, 1), datetime.date(2024, 1, 2))
+
+    assert connection.last_cursor.executed[1] == {"end_date": "2024-01-02", "start_date": "2024-01-01"}
+    assert str(facts["Day"].dtype).startswith("datetime64")
+    assert facts["Source Chain"].dtype == "category"
+    assert facts["Path"].dtype == "category"
+    assert facts["Swapper"].tolist() == [2**62 + 1, MISSING_SENDER]
+    assert facts["Number of Swaps"].dtype == np.int64
+
+
+def categorical(values):
+    return pd.Series(values, dtype="category")
+
+
+def test_path_column_labels_each_route_and_nulls_missing_chains():
+    source = categorical(["ethereum", "polygon", None, "ethereum", "polygon"])
+    destination = categorical(["arbitrum", "arbitrum", "base", None, "arbitrum"])
+
+    path = semantic.path_column(source, destination)
+
+    assert list(path.categories) == ["ethereum➡arbitrum", "polygon➡arbitrum"]
+    assert pd.Series(path).tolist()[:2] == ["ethereum➡arbitrum", "polygon➡arbitrum"]
+    assert pd.isna(path[2]) and pd.isna(path[3])
+    assert path[4] == "polygon➡arbitrum"
+
+
+def test_path_column_without_missing_chains():
+    path = semantic.path_column(categorical(["a", "b"]), categorical(["c", "c"]))
+    assert pd.Series(path).tolist() == ["a➡c", "b➡c"]
+
+
+def test_stats_by_keeps_null_chain_as_its_own_group():
+    source = categorical(["ethereum", None, None, "ethereum"])
+    facts = pd.DataFrame({
+        "Source Chain": source,
+        "Swapper": np.array([1, 1, 2, 3], dtype=np.int64),
+        "Number of Swaps": np.array([1, 2, 3, 4], dtype=np.int64),
+    })
+
+    stats = semantic.stats_by(facts, "Source Chain")
+
+    assert stats["Source Chain"].tolist()[0] == "ethereum"
+    assert pd.isna(stats["Source Chain"].tolist()[1])
+    assert stats["Number of Swaps"].tolist() == [5, 5]
+    assert stats["Number of Swappers"].tolist() == [2, 2]
+
+
+def test_swappers_distribution_matches_the_case_buckets():
+    # Totals on both sides of every CASE edge: = 1, (1-5], (5-10], (10-20], (20-50], 50+.
+    totals = [1, 2, 5, 6, 10, 11, 20, 21, 50, 51, 1]
+    facts = pd.DataFrame({
+        "Swapper": np.arange(len(totals), dtype=np.int64),
+        "Number of Swaps": np.array(totals, dtype=np.int64),
+    })
+
+    distribution = semantic.swappers_distribution(facts)
+
+    assert dict(zip(distribution["Number of Swaps"], distribution["Number of Swappers"])) == {
+        "Only 1 Transactions": 2,
+        "(1-5] Transactions": 2,
+        "(5-10] Transactions": 2,
+        "(10-20] Transactions": 2,
+        "(20-50] Transactions": 2,
+        "50+ Transactions": 1,
+    }
+    assert distribution["Number of Swappers"].is_monotonic_decreasing
+
+
+def test_swappers_distribution_sums_a_swapper_across_rows_and_skips_null_senders():
+    facts = pd.DataFrame({
+        "Swapper": as_hashes([7, 7, None]),
+        "Number of Swaps": np.array([3, 3, 9], dtype=np.int64),
+    })
+
+    distribution = semantic.swappers_distribution(facts)
+
+    assert distribution.to_dict("list") == {"Number of Swaps": ["(5-10] Transactions"], "Number of Swappers": [1]}
@@ -0,0 +1,31 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from senders import (
+    MISSING_SENDER, as_sender_hashes, count_distinct, count_distinct_by, sum_per_sender, top_senders
+)
+
+
+def test_null_senders_become_the_missing_marker():
+    hashes = as_sender_hashes(pd.Series([7, None, -3], dtype="Int64"))
+    assert hashes.dtype == np.int64
+    assert hashes.tolist() == [7, MISSING_SENDER, -3]
+
+
+def test_null_senders_are_not_counted_as_a_swapper():
+    hashes = pd.Series([7, None, 7, None, -3], dtype="Int64")
+    assert count_distinct(hashes) == 2
+
+    uniques, totals = sum_per_sender(hashes, [1, 5, 2, 5, 4])
+    assert dict(zip(uniques.tolist(), totals.tolist())) == {-3: 4, 7: 3}
+
+    top, swaps = top_senders(hashes, [1, 5, 2, 5, 4], 5)
+    assert top.tolist() == [-3, 7] and swaps.tolist() == [4, 3]
+
+
+def test_count_distinct_by_counts_each_sender_once_per_group():
+    group_codes = [0, 0, 0, 1, 1, np.nan]
+    hashes = pd.Series([7, 7, None, 7, 9, 9], dtype="Int64")
+    assert count_distinct_by(group_codes, hashes, 3).tolist() == [1, 2, 0]